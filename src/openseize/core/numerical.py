@@ -1,13 +1,14 @@
 import numpy as np
 import itertools
-from functools import partial
+from functools import lru_cache, partial
 import scipy.signal as sps
+from scipy.fft import rfft, irfft, rfftfreq, next_fast_len
+from numpy.lib.stride_tricks import sliding_window_view
 
 from openseize import producer
-from openseize.core.producer import Producer, as_producer, pad_producer 
+from openseize.core.producer import Producer, as_producer
 from openseize.core.queues import FIFOArray
-from openseize.core.arraytools import (pad_along_axis, slice_along_axis,
-        multiply_along_axis, split_along_axis)
+from openseize.core.arraytools import slice_along_axis
 
 
 def optimal_nffts(arr):
@@ -26,10 +27,38 @@ def optimal_nffts(arr):
         arr is the length of the convolving window.
         see https://en.wikipedia.org/wiki/Overlap-add_method
 
+    The estimate is rounded up to the next 5-smooth (2, 3, 5 factorable)
+    size which scipy's pocketfft transforms fastest for real inputs.
+
     Returns: Integer number of NFFT pts.
     """
 
-    return int(8 * 2 ** np.ceil(np.log2(len(arr))))
+    return next_fast_len(8 * len(arr), real=True)
+
+
+@lru_cache(maxsize=16)
+def _window_spectrum(window_bytes, dtype, nfft, fft_dtype):
+    """Returns the cached real FFT of a convolving window.
+
+    Args:
+        window_bytes: bytes
+            The raw bytes of a 1-D window array (see ndarray.tobytes).
+        dtype: str
+            The string datatype of the window's elements.
+        nfft: int
+            The number of FFT points.
+        fft_dtype: str
+            The string complex datatype of the returned spectrum. This
+            should match the precision of the data's FFT.
+
+    Returns: A read-only 1-D array of length nfft//2 + 1.
+    """
+
+    window = np.frombuffer(window_bytes, dtype=dtype)
+    result = rfft(window, nfft).astype(fft_dtype, copy=False)
+    # the cached spectrum is shared across calls; prevent mutation
+    result.flags.writeable = False
+    return result
 
 
 def convolved_shape(shape1, shape2, mode, axis):
@@ -149,7 +178,40 @@ def _oa_boundary(arr, window, side, axis, mode):
     return arr[tuple(slices)]
 
 
-def oaconvolve(pro, window, axis, mode, nfft_factor=32):
+def _oa_combine(z, overlap, step, wlen):
+    """Overlap-adds a batch of circularly convolved segments.
+
+    Args:
+        z: ndarray
+            An array of shape (..., nsegs, nfft) of circularly convolved
+            segments, each computed from step samples of data.
+        overlap: ndarray
+            The (..., wlen-1) overhang of the segment preceding this batch.
+        step: int
+            The number of data samples in each segment.
+        wlen: int
+            The length of the convolving window.
+
+    Returns:
+        An array of shape (..., nsegs * step) of overlap-added samples and
+        the (..., wlen-1) overhang of the last segment in z.
+
+    Note: The bookkeeping is vectorized across all segments and channels
+    so no Python level loop over segments is needed. Only the final
+    reshape copies data; all other operations act on views of z.
+    """
+
+    y = z[..., :step]
+    # add each segments overhang to the start of the next segment
+    y[..., 1:, :wlen-1] += z[..., :-1, step:step+wlen-1]
+    y[..., 0, :wlen-1] += overlap
+
+    nsegs = z.shape[-2]
+    y = y.reshape(*z.shape[:-2], nsegs * step)
+    return y, z[..., -1, step:step+wlen-1]
+
+
+def oaconvolve(pro, window, axis, mode, nfft_factor=2):
     """Performs overlap-add circular convolution of a producer of 
     ndarrays with a 1-dimensional window.
 
@@ -167,7 +229,8 @@ def oaconvolve(pro, window, axis, mode, nfft_factor=32):
             A power of 2 that multiplies the optimal number of nffts
             used by this algorithms circular convolution. Increasing this
             number by factors of 2 may increase the speed of this algorithm.
-            Defaults to 32 (see Implementation Notes)
+            Powers of 2 preserve the 5-smooth size of the optimal nffts.
+            Defaults to 2 (see Implementation Notes)
 
     Numpy & Scipy implementations of oaconvolve require that the input be an
     in-memory array. Openseize utilizes a producer making it suitable for
@@ -184,12 +247,20 @@ def oaconvolve(pro, window, axis, mode, nfft_factor=32):
     The additional nfft_factor effectively increases the amount of samples
     that the algorithm will convolve at once. By increasing the nffts above
     the optimal value for the FFT algorithm, we allow oaconvolve to convolve
-    more data at a single time which reduces the data fetches. This improves
-    performance up until the processors cache size is reached. The value
-    should be decreased if the window is large and increased if the window
-    is small to improve performance.
-
-    Returns: A generator of convolved ndarrays.
+    more data at a single time. Since segments are batched (see below) the
+    data fetches no longer depend on nfft, so large factors only push each
+    FFT out of the processors cache. The value should be decreased if the
+    window is large. The number of FFT points used is the 5-smooth size
+    from optimal_nffts times nfft_factor or, if that exceeds the data
+    length, the 5-smooth size alone. Each segment then holds
+    nfft - len(window) + 1 data samples.
+
+    When the producer's chunksize spans several segments, the segments in
+    each chunk are stacked and transformed with a single multi-threaded FFT
+    call. This amortizes the per-call FFT overhead across the chunk.
+
+    Returns: A generator of convolved ndarrays. Single precision (float32)
+             data is convolved and returned in single precision.
     """
 
     # compute the near optimal nfft number and FFT of window
@@ -200,35 +271,70 @@ def oaconvolve(pro, window, axis, mode, nfft_factor=32):
         nfft = optimal_nffts(window)
 
     wlen = len(window)
-    H = np.fft.rfft(window, nfft)
+    window = np.asarray(window)
+    window_bytes = window.tobytes()
 
     # set the step size based on optimal nfft and wlen
     step = nfft - wlen + 1
 
-    nsegments = int(np.ceil(pro.shape[axis] / step))
-
     # create the wlen-1 samples overlap
     overlap_shape = list(pro.shape)
     overlap_shape[axis] = wlen - 1
     overlap = np.zeros(overlap_shape)
 
-    # FIFOArray holding chunksize arrays but yielding step size arrays
-    fifo = FIFOArray(step, axis)
+    # number of step sized segments circularly convolved per FFT call
+    # limited so the float64 segments of all channels fit in ~4 MB cache
+    nchannels = int(np.prod(pro.shape)) // pro.shape[axis]
+    ncached = 2**22 // (8 * nfft * nchannels)
+    nbatch = max(1, min(pro.chunksize // step, ncached))
+
+    # FIFOArray holding chunksize arrays but yielding nbatch * step arrays
+    fifo = FIFOArray(nbatch * step, axis)
 
     # Helper funcs
-    def _cconvolve(x, H, nfft, wlen, axis):
+    def _spectrum(xf):
+        """Returns the window's FFT in the precision of the data's FFT, xf,
+        so float32 data is convolved in single precision."""
+
+        return _window_spectrum(window_bytes, window.dtype.str, nfft,
+                                xf.dtype.str)
+
+    def _cconvolve(x, nfft, axis):
         """Circularly convolves a data segment, x, with H, the 
-        fft of the window of len wlen along axis."""
+        fft of the window along axis."""
         
-        # pad with wlen-1 zeros for overlap & FFT
-        x = pad_along_axis(x, [0, wlen - 1], axis=axis)
-        xf = np.fft.rfft(x, nfft, axis=axis)
+        # rfft zero pads x to nfft covering the wlen-1 overlap
+        xf = rfft(x, nfft, axis=axis)
             
-        # take product with window in freq. domain
-        product = multiply_along_axis(xf, H, axis=axis)
+        # take product with window in freq. domain in-place
+        H = _spectrum(xf)
+        shape = np.ones(xf.ndim, int)
+        shape[axis] = len(H)
+        xf *= H.reshape(shape)
 
         # back transform to sample domain and return
-        return  np.fft.irfft(product, axis=axis).real
+        return irfft(xf, nfft, axis=axis)
+
+    def _batch_cconvolve(x, nsegs, overlap):
+        """Circularly convolves nsegs consecutive step sized segments of x
+        in a single FFT call and overlap-adds the results.
+
+        Returns the overlap-added segments and the wlen-1 sample overlap
+        of the last segment, both oriented along axis.
+        """
+
+        # stack segments along a new axis placed before the convolve axis
+        x = np.moveaxis(x, axis, -1)
+        segs = x.reshape(*x.shape[:-1], nsegs, step)
+
+        # rfft zero pads each segment to nfft; multiply by H in-place
+        xf = rfft(segs, nfft, axis=-1, workers=-1)
+        xf *= _spectrum(xf)
+        z = irfft(xf, nfft, axis=-1, workers=-1)
+
+        y, new_overlap = _oa_combine(z, np.moveaxis(overlap, axis, -1),
+                                     step, wlen)
+        return np.moveaxis(y, -1, axis), np.moveaxis(new_overlap, -1, axis)
 
     def _add_overlap(y, overlap, wlen, axis):
         """Adds overlap to first wlen-1 samples of yth segment 
@@ -245,18 +351,10 @@ def _add_overlap(y, overlap, wlen, axis):
 
         fifo.put(arr)
 
-        while fifo.qsize() > step:
+        while fifo.qsize() > nbatch * step:
            
-            # get data segment & cicularly convolve
-            arr = fifo.get()
-            z = _cconvolve(arr, H, nfft, wlen, axis)
-            
-            #split segment & next overlap
-            y, new_overlap = split_along_axis(z, step, axis=axis)
-
-            # add previous overlap & update overlap
-            y = _add_overlap(y, overlap, wlen, axis)
-            overlap = new_overlap
+            # get nbatch data segments, circularly convolve & overlap-add
+            y, overlap = _batch_cconvolve(fifo.get(), nbatch, overlap)
 
             #apply the boundary mode to first and last segments
             if segment == 0:
@@ -271,12 +369,26 @@ def _add_overlap(y, overlap, wlen, axis):
             # put new data into fifo
             continue
     else:
+
+        # convolve all remaining whole segments except the last
+        nsegs = (fifo.qsize() - 1) // step
+        if nsegs > 0:
+
+            fifo.chunksize = nsegs * step
+            y, overlap = _batch_cconvolve(fifo.get(), nsegs, overlap)
+
+            if segment == 0:
+                y = _oa_boundary(y, window, 'left', axis, mode)
+
+            segment += 1
+
+            yield y
         
         if not fifo.empty():
            
             # get all remaining in queue & circularly convolve
             arr = fifo.queue
-            z = _cconvolve(arr, H, nfft, wlen, axis)
+            z = _cconvolve(arr, nfft, axis)
 
             # last segment has wlen - 1 overhang
             last = arr.shape[axis] + wlen - 1
@@ -370,34 +482,28 @@ def sosfiltfilt(pro, sos, axis, **kwargs):
     s[axis] = 2
     zi = np.reshape(zi, (sos.shape[0], *s)) #nsections,1,2
 
-    # build a generators of forward filtered with one advanced
-    a_gen = iter(sosfilt(pro, sos, axis, zi=zi*x0))  
-    b_gen = iter(sosfilt(pro, sos, axis, zi=zi*x0))
-    next(b_gen)
+    # forward filter once, holding one filtered array to look ahead to
+    fgen = iter(sosfilt(pro, sos, axis, zi=zi*x0))
+    a = next(fgen)
+    for b in fgen:
 
-    n = int(np.ceil(pro.shape[axis] / pro.chunksize))
-    for idx, a in enumerate(a_gen, 1):
+        # for reverse filter, use final delay values from flipped
+        # advanced 'b' arr as initial values for current flipped arr. 
+        # flips are views; sosfilt makes the only contiguous copy
+        bflipped = np.flip(b, axis=axis)
+        b_0 = slice_along_axis(bflipped, 0, 1, axis=axis)
+        _, zf = sps.sosfilt(sos, bflipped, axis=axis, zi=zi*b_0)
 
-        if idx < n:
+        aflipped = np.flip(a, axis=axis)
+        rfilt, _ = sps.sosfilt(sos, aflipped, axis=axis, zi=zf)
+        yield np.flip(rfilt, axis=axis)
+        a = b
 
-            b = next(b_gen)
-            # for reverse filter, use final delay values from flipped
-            # advanced 'b' arr as initial values for current flipped arr. 
-            bflipped = np.flip(b, axis=axis)
-            b_0 = slice_along_axis(bflipped, 0, 1, axis=axis)
-            _, zf = sps.sosfilt(sos, bflipped, axis=axis, zi=zi*b_0)
-
-            aflipped = np.flip(a, axis=axis)
-            rfilt, _ = sps.sosfilt(sos, aflipped, axis=axis, zi=zf)
-            yield np.flip(rfilt, axis=axis)
-
-        else:
-            
-            # for last segment the initial condition is last sample ss
-            aflipped = np.flip(a, axis=axis)
-            a0 = slice_along_axis(aflipped, 0, 1, axis=axis)
-            rfilt, _ = sps.sosfilt(sos, aflipped, axis=axis, zi=zi*a0)
-            yield np.flip(rfilt, axis=axis)
+    # for last segment the initial condition is last sample ss
+    aflipped = np.flip(a, axis=axis)
+    a0 = slice_along_axis(aflipped, 0, 1, axis=axis)
+    rfilt, _ = sps.sosfilt(sos, aflipped, axis=axis, zi=zi*a0)
+    yield np.flip(rfilt, axis=axis)
 
 
 @as_producer
@@ -509,6 +615,38 @@ def filtfilt(pro, coeffs, axis, **kwargs):
             yield np.flip(rfilt, axis=axis)
 
 
+def _polyphase_filter(h, L, M):
+    """Returns an interpolation/antialiasing filter prepared for scipy's
+    polyphase upfirdn and the number of leading upfirdn output samples
+    that precede the first resampled sample.
+
+    The filter is scaled by L to compensate for the L-1 inserted zeros and
+    zero padded so that resampled samples are centered on the input samples.
+    This matches scipy's resample_poly but is computed once per resampling
+    rather than once per resampled chunk. Upfirdn applies each of the L
+    polyphase sub-filters directly to the strided input samples without
+    forming the zero-stuffed upsampled signal, so it is used in preference
+    to a matrix product over sliding windows of the input which requires
+    the same number of multiplications but is slower in practice.
+
+    Args:
+        h: 1-D array
+            The FIR coeffecients of the combined antialiasing and
+            interpolation filter.
+        L: int
+            The expansion factor.
+        M: int
+            The decimation factor.
+
+    Returns: A 1-D array of filter coeffecients and an integer offset.
+    """
+
+    half_len = (len(h) - 1) // 2
+    npre = M - half_len % M
+    coeffs = np.concatenate((np.zeros(npre), L * h))
+    return coeffs, (half_len + npre) // M
+
+
 def polyphase_resample(pro, L, M, fs, fir, axis, **kwargs):
     """Resamples an array or producer of arrays by a rational factor (L/M)
     using the polyphase decomposition.
@@ -527,7 +665,9 @@ def polyphase_resample(pro, L, M, fs, fir, axis, **kwargs):
         fs: int
             The sampling rate of produced data in Hz.
         fir: FIR filter
-            An openseize fir filter class
+            An openseize fir filter class or an instance of one. If an
+            instance, its coeffecients are used as the antialiasing &
+            interpolation filter and kwargs are ignored.
         axis: int
             The axis of produced data along which downsampling will occur.
         kwargs:
@@ -565,60 +705,233 @@ def polyphase_resample(pro, L, M, fs, fir, axis, **kwargs):
         csize = pro.shape[axis]  // 3
 
     # kaiser antialiasing & interpolation filter coeffecients
-    cutoff = fs / (2*max(L, M))
-    fstop = kwargs.pop('fstop', cutoff + cutoff / 10)
-    fpass = kwargs.pop('fpass', cutoff - cutoff / 10)
-    gpass, gstop = kwargs.pop('gpass', 0.1), kwargs.pop('gstop', 40)
-    h = fir(fpass, fstop, fs, gpass, gstop).coeffs
+    if isinstance(fir, type):
+        cutoff = fs / (2*max(L, M))
+        fstop = kwargs.pop('fstop', cutoff + cutoff / 10)
+        fpass = kwargs.pop('fpass', cutoff - cutoff / 10)
+        gpass, gstop = kwargs.pop('gpass', 0.1), kwargs.pop('gstop', 40)
+        h = fir(fpass, fstop, fs, gpass, gstop).coeffs
+    else:
+        h = fir.coeffs
+
+    # num pts to append left & right on axis to cover convolve overhang
+    # must be divisible by M to ensure int slicing after resample.
+    overhang = int(np.ceil((len(h) - 1) / M) * M)
+
+    # pads are taken from neighboring chunks so chunks must cover overhang
+    if overhang > pro.shape[axis] // 3:
+        msg = ('A filter with {} taps requires at least {} samples along '
+               'axis but pro.shape[{}] = {}')
+        raise ValueError(msg.format(len(h), 3 * overhang, axis,
+                                    pro.shape[axis]))
+    csize = max(csize, overhang)
 
     # ensure decimation of each produced array is integer samples
     if csize % M > 0:
         csize = int(np.ceil(csize / M) * M)
 
-    # iterators for prior, current and next chunks of data
-    x = producer(pro, csize, axis)
-    y = producer(pro, csize, axis)
-    z = producer(pro, csize, axis)
-    iprior, icurrent, inext = (iter(pro) for pro in [x,y,z])
-
-    # num pts to append left & right on axis to cover convolve overhang
-    # must be divisible by M to ensure int slicing after resample.
-    overhang = int(np.ceil((len(h) - 1) / M) * M)
+    # a single pass over the data holding the prior & next chunks
+    chunks = producer(pro, csize, axis)
+    ichunks = iter(chunks)
 
     # initialize left/right pads for first data section
     left_shape = list(pro.shape)
     left_shape[axis] = overhang
     left = np.zeros(left_shape)
-    # advance inext twice to get right pads
-    next(inext)
-    right = slice_along_axis(next(inext), 0,  overhang, axis=axis)
+    # fetch the first chunk & the next chunk for the right pads
+    current, nxt = next(ichunks), next(ichunks)
+    right = slice_along_axis(nxt, 0,  overhang, axis=axis)
+
+    # filter & offset to resampled samples is the same for all chunks
+    coeffs, offset = _polyphase_filter(h, L, M)
+    # num. resampled points computed from the left & right pads
+    trim = int(overhang * L / M)
+
+    def _resample(padded):
+        """Resamples a padded chunk removing points computed from pads."""
+
+        resampled = sps.upfirdn(coeffs, padded, L, M, axis=axis)
+        nout = int(np.ceil(padded.shape[axis] * L / M))
+        start, stop = offset + trim, offset + nout - trim
+        return slice_along_axis(resampled, start, stop, axis=axis)
+
+    def _fill(buffer, *arrs):
+        """Copies arrays into consecutive slices of buffer along axis."""
+
+        start = 0
+        for arr in arrs:
+            stop = start + arr.shape[axis]
+            slice_along_axis(buffer, start, stop, axis=axis)[...] = arr
+            start = stop
+        return buffer
+
+    # preallocate a buffer for a chunk & its left and right pads
+    shape = list(pro.shape)
+    shape[axis] = csize + 2 * overhang
+    padded = np.empty(shape, dtype=np.result_type(float, current))
 
     # compute the first resampled chunk
-    current = next(icurrent)
-    padded = np.concatenate((left, current, right), axis=axis)
-    resampled = sps.resample_poly(padded, up=L, down=M, axis=axis, window=h)
-
-    # remove result points computed from pads
-    a, b = int(overhang * L / M), -int(overhang * L / M)
-    yield slice_along_axis(resampled, a, b, axis=axis)
+    yield _resample(_fill(padded, left, current, right))
 
     # resample remaining chunks
-    cnt = z.shape[axis] // csize + bool(z.shape[axis] % csize) - 1
-    for n, (last, curr, nxt) in enumerate(zip(iprior, icurrent, inext), 1):
+    cnt = chunks.shape[axis] // csize + bool(chunks.shape[axis] % csize) - 1
+    last, curr = current, nxt
+    for n, nxt in enumerate(ichunks, 1):
 
         # build left and right pads for current
         left = slice_along_axis(last, -overhang, axis=axis)
         
         if n < cnt - 1:
             right = slice_along_axis(nxt, 0, overhang, axis=axis)
+            yield _resample(_fill(padded, left, curr, right))
+
         else:
-            # at cnt-1 chunks concantenate next to current
-            curr = np.concatenate((curr, nxt), axis=axis) 
-            right = np.zeros(left.shape)
+            # at cnt-1 chunks place next after current with zero right pad
+            shape[axis] = curr.shape[axis] + nxt.shape[axis] + 2 * overhang
+            final = np.zeros(shape, dtype=padded.dtype)
+            yield _resample(_fill(final, left, curr, nxt))
+
+        last, curr = curr, nxt
+
+
+@lru_cache(maxsize=32)
+def _window_norm(window, n, fs, scaling):
+    """Returns the cached coeffecients of a window and the square root of
+    the normalization for DFTs of windowed data.
+
+    Args:
+        window: str
+            A scipy signal module window function.
+        n: int
+            The number of window coeffecients.
+        fs: int
+            The sampling rate of the windowed data.
+        scaling: str
+            One of 'spectrum' or 'density'. See modified_dft.
+
+    Returns: A read-only 1-D array of window coeffecients and a float
+             normalization.
+    """
+
+    coeffs = sps.get_window(window, n)
+    coeffs.flags.writeable = False
+
+    # scale using weighted mean of window values
+    if scaling == 'spectrum':
+        norm = 1 / np.sum(coeffs)**2
+
+    elif scaling == 'density':
+        #process loss Shiavi Eqn 7.54
+        norm = 1 / (fs * (coeffs @ coeffs))
+    
+    else:
+        msg = 'Unknown scaling: {}'
+        raise ValueError(msg.format(scaling))
+
+    return coeffs, np.sqrt(norm)
+
+
+@lru_cache(maxsize=32)
+def _linear_basis(n):
+    """Returns the cached basis and pseudo-inverse used to remove the least
+    squares line from n samples.
+
+    Args:
+        n: int
+            The number of samples to detrend.
+
+    Returns: A read-only n x 2 basis array of a ramp and a constant and its
+             read-only 2 x n pseudo-inverse.
+    """
+
+    basis = np.ones((n, 2))
+    basis[:, 0] = np.arange(1, n + 1) / n
+    pinv = np.linalg.pinv(basis)
+    basis.flags.writeable = False
+    pinv.flags.writeable = False
+
+    return basis, pinv
+
+
+def _windowed_dft(arr, fs, nfft, window, axis, detrend, scaling):
+    """Returns the unnormalized DFT of a detrended and windowed real signal
+    and the square root of the normalization for that DFT.
+
+    The arguments are identical to modified_dft. This allows callers to
+    fold the normalization into a later pass over the DFT.
+
+    Returns:
+        A 1-D array of positive frequencies, an ndarray of unnormalized DFT
+        values and a float normalization.
+    """
+
+    nsamples = arr.shape[axis]
+
+    if nfft < nsamples:
+        # crop arr before detrending & windowing; see rfft crop
+        arr = slice_along_axis(arr, 0, nfft, axis=-1)
+
+    # detrend the array into a new array that is windowed in-place
+    if detrend in ('constant', 'c'):
+        arr = np.subtract(arr, arr.mean(axis=axis, keepdims=True))
+    elif detrend in ('linear', 'l'):
+        # fit & subtract the line of each segment with two matmuls
+        basis, pinv = _linear_basis(arr.shape[axis])
+        x = np.moveaxis(arr, axis, -1)
+        if x.dtype == np.float32:
+            basis, pinv = basis.astype(x.dtype), pinv.astype(x.dtype)
+        trend = (x @ pinv.T) @ basis.T
+        arr = np.moveaxis(np.subtract(x, trend, out=trend), -1, axis)
+    else:
+        arr = sps.detrend(arr, axis=axis, type=detrend)
+
+    # fetch and apply window; rectangular windows leave arr unchanged
+    coeffs, norm = _window_norm(window, arr.shape[axis], fs, scaling)
+    if not np.array_equiv(coeffs, 1):
+        shape = np.ones(arr.ndim, int)
+        shape[axis] = len(coeffs)
+        arr *= coeffs.reshape(shape)
+
+    # compute real DFT. Zeropad for nfft > nsamples is automatic
+    # rfft uses 'backward' norm default which is no norm on rfft
+    arr = rfft(arr, nfft, axis=axis, workers=-1)
+    freqs = rfftfreq(nfft, d=1/fs)
+
+    return freqs, arr, norm
+
+
+@lru_cache(maxsize=32)
+def _periodogram_weights(window, n, fs, scaling, nfft):
+    """Returns the cached weights that normalize and double the positive
+    frequencies of a power spectrum computed from a real DFT.
+
+    Args:
+        window: str
+            A scipy signal module window function.
+        n: int
+            The number of window coeffecients.
+        fs: int
+            The sampling rate of the windowed data.
+        scaling: str
+            One of 'spectrum' or 'density'. See modified_dft.
+        nfft: int
+            The number of DFT points.
+
+    Returns: A read-only 1-D array of length nfft//2 + 1.
+    """
+
+    _, norm = _window_norm(window, n, fs, scaling)
+
+    # since real FFT -> double for uncomputed negative freqs.
+    weights = np.full(nfft // 2 + 1, 2 * norm**2)
+    # k=0 dft sample is not pos. or neg so not doubled
+    weights[0] /= 2
+    if not nfft % 2:
+        # last k=nfft/2 is its own negative freq. when nfft is even
+        weights[-1] /= 2
 
-        padded = np.concatenate((left, curr, right), axis=axis)
-        resampled = sps.resample_poly(padded, L, M, axis=axis, window=h)
-        yield slice_along_axis(resampled, a, b, axis=axis)
+    weights.flags.writeable = False
+    return weights
 
 
 def modified_dft(arr, fs, nfft, window, axis, detrend, scaling):
@@ -670,39 +983,12 @@ def modified_dft(arr, fs, nfft, window, axis, detrend, scaling):
         https://docs.scipy.org/doc/scipy/reference/signal.windows.html
     """
 
-    nsamples = arr.shape[axis]
-
-    if nfft < nsamples:
-        # crop arr before detrending & windowing; see rfft crop
-        arr = slice_along_axis(arr, 0, nfft, axis=-1)
-
-    # detrend the array
-    arr = sps.detrend(arr, axis=axis, type=detrend)
-
-    # fetch and apply window
-    coeffs = sps.get_window(window, arr.shape[axis])
-    arr = multiply_along_axis(arr, coeffs, axis=axis)
-
-    # compute real DFT. Zeropad for nfft > nsamples is automatic
-    # rfft uses 'backward' norm default which is no norm on rfft
-    arr = np.fft.rfft(arr, nfft, axis=axis)
-    freqs = np.fft.rfftfreq(nfft, d=1/fs)
-
-    # scale using weighted mean of window values
-    if scaling == 'spectrum':
-        norm = 1 / np.sum(coeffs)**2
+    freqs, arr, norm = _windowed_dft(arr, fs, nfft, window, axis, detrend,
+                                     scaling)
 
-    elif scaling == 'density':
-        #process loss Shiavi Eqn 7.54
-        norm = 1 / (fs * np.sum(coeffs**2))
-    
-    else:
-        msg = 'Unknown scaling: {}'
-        raise ValueError(msg.format(scaling))
-   
     # before conjugate multiplication unlike scipy
     # see _spectral_helper lines 1808 an 1842.
-    arr *= np.sqrt(norm)
+    arr *= norm
 
     return freqs, arr
 
@@ -765,78 +1051,147 @@ def periodogram(arr, fs, nfft=None, window='hann', axis=-1,
 
     nfft = arr.shape[axis] if not nfft else int(nfft)
     
-    # compute modified DFT & take modulus to get power spectrum
-    freqs, arr = modified_dft(arr, fs, nfft, window, axis, detrend, scaling)
-    arr = np.real(arr)**2 + np.imag(arr)**2 
-
-    # since real FFT -> double for uncomputed negative freqs.
-    slicer = [slice(None)] * arr.ndim
-    if nfft % 2:
-        # k=0 dft sample is not pos. or neg so not doubled
-        slicer[axis] = slice(1, None)
-    
-    else:
-        # last k=nfft/2 is not in the dft since nfft is odd
-        slicer[axis] = slice(1, -1)
-    
-    arr[tuple(slicer)] *= 2
-
-    return freqs, arr
-
-
-def _spectra_estimatives(pro, fs, nfft, window, overlap, axis, detrend,
-                         scaling, func, **kwargs):
-    """Iteratively estimates the power spectrum or modified DFT for each
-    nfft segment in a producer.
-
-    This generator yields an estimate for each nfft segment. It should not
-    be called externally.
+    # compute DFT & take modulus to get power spectrum
+    freqs, dft, _ = _windowed_dft(arr, fs, nfft, window, axis, detrend,
+                                  scaling)
+    # square imag. part in-place so only the result array is allocated
+    power = np.square(dft.real)
+    power += np.square(dft.imag, out=dft.imag)
+
+    # normalize & double positive freqs. in a single pass
+    weights = _periodogram_weights(window, min(nfft, arr.shape[axis]), fs,
+                                   scaling, nfft)
+    shape = np.ones(power.ndim, int)
+    shape[axis] = len(weights)
+    power *= weights.reshape(shape)
+
+    return freqs, power
+
+
+def _spectra_blocks(pro, fs, nfft, window, overlap, axis, detrend,
+                    scaling, func, **kwargs):
+    """Iteratively estimates the power spectrum or modified DFT for blocks
+    of nfft segments in a producer.
+
+    This generator should not be called externally. Produced arrays are
+    collected until a block of many segments is available and all segments
+    in the block are estimated together in a single call to func. Each
+    yielded block has the producer's non-sample axes first followed by a
+    segment axis and a frequency axis.
 
     Args:
         func: function
             A function returning a spectral estimate for a window of data.
             E.g. periodogram, modified_dft
-        kwargs: unused kwargs
-            Future support for additional spectral estimate functions.
+        kwargs: dict
+            Optional block options:
+
+            - max_block_bytes: The approximate maximum number of bytes of
+              float64 segment data estimated in a single call to func. This
+              bounds the memory of the estimate when the producer yields
+              large arrays. Blocks that fit in cache are fastest. Defaults
+              to 4 MB.
+            - pad: A 2-el sequence of the number of zeros to place before
+              the first and after the last produced sample along axis.
+              Padding here avoids rechunking the producer through
+              pad_producer. Defaults to (0, 0).
+            - dtype: The floating point datatype in which segments are
+              estimated. If None (Default), segments are estimated in
+              float64. Arrays are cast as they enter the FIFO.
     """
 
+    max_block_bytes = kwargs.get('max_block_bytes', 2**22)
+    pad = kwargs.get('pad', (0, 0))
+    dtype = kwargs.get('dtype')
+    dtype = float if dtype is None else dtype
+
     # num overlap points & shift between successive nfft segments
     noverlap = int(nfft * overlap)
     stride = nfft - noverlap
+    axis = axis % len(pro.shape)
 
-    # use FIFO to cache & release nfft & stride  num. samples respectively
-    fifo = FIFOArray(chunksize=stride, axis=axis)
-    for n, arr in enumerate(pro):
+    # num. of segments & samples in a block of at most max_block_bytes
+    segment_bytes = 8 * nfft * int(np.prod(pro.shape)) // pro.shape[axis]
+    nbatch = max(1, max_block_bytes // segment_bytes)
+    blocksize = nfft + (nbatch - 1) * stride
+
+    # use FIFO to cache & release stride num. samples per segment; samples
+    # are moved to the last axis so each segment is contiguous in memory
+    fifo = FIFOArray(chunksize=stride, axis=-1)
+
+    def _estimates():
+        """Yields estimates for all nfft segments in the FIFO in blocks of
+        at most nbatch segments."""
 
-        # yield nfft sized estimates while fifo has >= nfft samples
         while fifo.qsize() >= nfft:
-            
-            # slice nfft samples to compute estimate
-            x = slice_along_axis(fifo.queue, 0, nfft, axis=axis)
-            f, y = func(x, fs, nfft, window, axis, detrend, scaling)
-            
-            # release stride samples leaving nover in FIFO
+
+            # batch nfft segments in fifo as views along a new last axis
+            nsegs = min(nbatch, (fifo.qsize() - nfft) // stride + 1)
+            segments = sliding_window_view(fifo.queue, nfft, axis=-1)
+            segments = slice_along_axis(segments, 0, nsegs * stride, stride,
+                                        axis=-2)
+            f, y = func(segments, fs, nfft, window, -1, detrend, scaling)
+
+            # release stride samples per segment leaving nover in FIFO
+            fifo.chunksize = nsegs * stride
             fifo.get()
+
             yield y
-        
-        else:
-            
-            # provide fifo with more samples
-            fifo.put(arr)
+
+    def _put(arrs):
+        """Puts a list of arrays into the FIFO with one concatenate that
+        also moves their samples to the last axis."""
+
+        arrs = [np.moveaxis(arr, axis, -1) for arr in arrs]
+        if len(arrs) > 1:
+            fifo.put(np.concatenate(arrs, axis=-1, dtype=dtype))
+        elif arrs:
+            fifo.put(np.ascontiguousarray(arrs[0], dtype=dtype))
+
+    # zero pads placed before the first & after the last produced array
+    pads = []
+    for amt in pad:
+        shape = list(pro.shape)
+        shape[axis] = amt
+        pads.append([np.zeros(shape)] if amt else [])
+
+    # collect produced arrays until a block of segments is available
+    collected, ncollected = pads[0], pad[0]
+    for arr in pro:
+
+        collected.append(arr)
+        ncollected += arr.shape[axis]
+        if fifo.qsize() + ncollected < blocksize:
             continue
-    
-    else:
-        
-        # exhaust the fifo
-        while fifo.qsize() >= nfft:
-            
-            x = slice_along_axis(fifo.queue, 0, nfft, axis=axis)
-            f, y = func(x, fs, nfft, window, axis, detrend, scaling)
-            fifo.get() 
-            yield y
 
+        _put(collected)
+        collected, ncollected = [], 0
+        yield from _estimates()
+
+    # estimate any segments remaining in the last partial block
+    _put(collected + pads[1])
+    yield from _estimates()
 
-def welch(pro, fs, nfft, window, overlap, axis, detrend, scaling):
+
+def _spectra_estimatives(pro, fs, nfft, window, overlap, axis, *args,
+                         **kwargs):
+    """Iteratively estimates the power spectrum or modified DFT for each
+    nfft segment in a producer.
+
+    This generator yields an estimate for each nfft segment. It should not
+    be called externally. The arguments are identical to _spectra_blocks.
+    """
+
+    axis = axis % len(pro.shape)
+    for y in _spectra_blocks(pro, fs, nfft, window, overlap, axis, *args,
+                             **kwargs):
+
+        # segments to 0th axis & estimates back to sample axis
+        yield from np.moveaxis(y, [-2, -1], [0, axis + 1])
+
+
+def welch(pro, fs, nfft, window, overlap, axis, detrend, scaling,
+          dtype=None):
     """Iteratively estimates the power spectrum using Welch's method.
 
     Welch's method divides data into overlapping segments and computes the
@@ -874,6 +1229,9 @@ def welch(pro, fs, nfft, window, overlap, axis, detrend, scaling):
             Determines the normalization to apply to the estimate. If
             'spectrum' the estimate will have units V**2 and if 'density'
             V**2 / Hz.
+        dtype: numpy datatype
+            The floating point datatype of the estimate. If None (Default),
+            the estimate is float64.
 
     Returns:
         A tuple containing a 1-D array of frequencies of length nfft//2 + 1
@@ -909,10 +1267,10 @@ def welch(pro, fs, nfft, window, overlap, axis, detrend, scaling):
 
     # build the welch generating function
     genfunc = partial(_spectra_estimatives, pro, fs, nfft, window, overlap, 
-                      axis, detrend, scaling, func=periodogram)
+                      axis, detrend, scaling, func=periodogram, dtype=dtype)
 
     # obtain the positive freqs.
-    freqs = np.fft.rfftfreq(nfft, 1/fs)
+    freqs = rfftfreq(nfft, 1/fs)
 
     # num. segments that fit into pro samples of len nfft with % overlap
     nsegs = int((pro.shape[axis] - nfft) // (nfft * (1-overlap)) + 1)
@@ -924,6 +1282,46 @@ def welch(pro, fs, nfft, window, overlap, axis, detrend, scaling):
     return freqs, result
 
 
+def welch_mean(pro, fs, nfft, window, overlap, axis, detrend, scaling,
+               dtype=None):
+    """Estimates the power spectrum using Welch's method by averaging the
+    modified periodograms of each block of segments as they are computed.
+
+    Unlike welch, this method returns the averaged estimate rather than a
+    producer of estimates for each segment. The arguments are identical to
+    welch.
+
+    Returns:
+        An integer number of segments averaged, a 1-D array of positive
+        frequencies and a float64 ndarray of the averaged estimate with
+        frequencies along axis.
+
+    Raises:
+        ValueError: pro has fewer than nfft samples along axis.
+    """
+
+    axis = axis % len(pro.shape)
+    freqs = rfftfreq(nfft, 1/fs)
+
+    # sum each block's estimates over its segment axis in float64
+    cnt, total = 0, 0
+    for y in _spectra_blocks(pro, fs, nfft, window, overlap, axis, detrend,
+                             scaling, func=periodogram, dtype=dtype):
+        block = y.sum(axis=-2, dtype=float)
+        if cnt:
+            total += block
+        else:
+            total = block
+        cnt += y.shape[-2]
+
+    if not cnt:
+        msg = 'Welch requires at least {} samples along axis but got {}'
+        raise ValueError(msg.format(nfft, pro.shape[axis]))
+
+    # frequencies back to the sample axis
+    return cnt, freqs, np.moveaxis(total / cnt, -1, axis)
+
+
 def stft(pro, fs, nfft, window, overlap, axis, detrend, scaling, boundary,
          padded):
     """Estimates the Discrete Short-time Fourier Transform of a real signal.
@@ -989,6 +1387,9 @@ def stft(pro, fs, nfft, window, overlap, axis, detrend, scaling, boundary,
         X: Producer of stft estimates for each segment. Each yielded array
            has length nfft - nfft * overlap along axis.
 
+    Raises:
+        ValueError: The padded producer is shorter than one nfft segment.
+
     Notes:
         Scipy allows for the segment length and number of DFT points (nfft)
         to be different. This allows for interpolation of frequencies. Given
@@ -1015,37 +1416,36 @@ def stft(pro, fs, nfft, window, overlap, axis, detrend, scaling, boundary,
     stride = nfft - noverlap
 
     # stft boundary & padding options
-    data = pro
+    pad = [0, 0]
     if boundary:
         
-        # center first & last segments by padding producer
-        data = pad_producer(data, nfft//2, value=0)
+        # center first & last segments by zero padding
+        pad = [nfft//2, nfft//2]
 
     if padded:
         
         nsamples = pro.shape[axis]
         # pad w/ stride if samples not divisible by stride
-        amt = stride if nsamples % stride else 0
-        data = pad_producer(data, [0, amt], value=0)
+        pad[1] += stride if nsamples % stride else 0
 
-    # build the stft generating function
-    genfunc = partial(_spectra_estimatives, data, fs, nfft, window, overlap, 
-                      axis, detrend, scaling, func=modified_dft)
+    # build the stft generating function; pads are placed by the generator
+    genfunc = partial(_spectra_estimatives, pro, fs, nfft, window, overlap, 
+                      axis, detrend, scaling, func=modified_dft, pad=pad)
 
     # obtain the positive freqs.
-    freqs = np.fft.rfftfreq(nfft, 1/fs)
+    freqs = rfftfreq(nfft, 1/fs)
     
     # num. segments that fit into pro samples of len nfft with % overlap
-    nsegs = int((data.shape[axis] - nfft) // (nfft * (1-overlap)) + 1)
-    shape = list(data.shape)
+    shape = list(pro.shape)
+    nsegs = (shape[axis] + sum(pad) - nfft) // stride + 1
+    if nsegs < 1:
+        msg = 'STFT requires at least {} samples along axis but got {}'
+        raise ValueError(msg.format(nfft - sum(pad), shape[axis]))
     shape[axis] = nsegs
 
-    # compute the segment times
-    if boundary:
-        time = 1 / fs * np.arange(0, data.shape[axis] - nfft + 1, nfft-noverlap)
-    else:
-        time = 1 / fs * np.arange(nfft//2, data.shape[axis] + 1 - nfft//2, 
-                                  nfft-noverlap)
+    # segment times; boundary padding centers the first segment at 0
+    offset = 0 if boundary else nfft // 2
+    time = (np.arange(nsegs) * stride + offset) * (1 / fs)
 
     # return producer from welch gen func with each yielded 
     result = producer(genfunc, chunksize=len(freqs), axis=axis, shape=shape)
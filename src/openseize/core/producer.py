@@ -47,6 +47,7 @@
 
 from openseize.core import mixins
 from openseize.core import resources
+from openseize.core.arraytools import slice_along_axis
 from openseize.core.queues import FIFOArray
 from openseize.file_io.edf import Reader
 
@@ -259,15 +260,28 @@ def chunksize(self, value):
     def shape(self):
         """Returns the shape of this producers data attr."""
 
-    def to_array(self, dtype=float):
+    def to_array(self, dtype=None):
         """Assign this Producer to an ndarray by concatenation along axis.
 
         Args:
             dtype: numpy datatype
-                The datatype of each sample in this Producer. Default is
-                float64.
+                The datatype of each sample in this Producer. If None
+                (Default), the datatype of the first produced array is used.
+
+        Each produced array is copied directly into a preallocated array
+        of dtype so the produced arrays are never all held in memory at
+        once.
+
+        Raises:
+            ValueError: the produced arrays exceed this Producer's shape
+                along axis.
         """
 
+        arrays = iter(self)
+        first = next(arrays, None)
+        if dtype is None:
+            dtype = float if first is None else first.dtype
+
         resource_result  = resources.assignable_array(self.shape, dtype)
         assignable, allowable, required = resource_result
 
@@ -276,7 +290,21 @@ def to_array(self, dtype=float):
             msg = 'Producer will consume {} GB but only {} GB are available'
             raise MemoryError(msg.format(a, b))
 
-        return np.concatenate(list(self), axis=self.axis)
+        result = np.empty(self.shape, dtype=dtype)
+        if first is None:
+            return slice_along_axis(result, 0, 0, axis=self.axis)
+
+        start = 0
+        for arr in itertools.chain([first], arrays):
+            stop = start + arr.shape[self.axis]
+            if stop > self.shape[self.axis]:
+                msg = ('Produced arrays exceed the {} samples of this '
+                       'Producer along axis {}')
+                raise ValueError(msg.format(self.shape[self.axis], self.axis))
+            slice_along_axis(result, start, stop, axis=self.axis)[...] = arr
+            start = stop
+
+        return slice_along_axis(result, 0, start, axis=self.axis)
 
 
 class ReaderProducer(Producer):
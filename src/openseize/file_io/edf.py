@@ -99,6 +99,7 @@
 """
 
 import copy
+import mmap
 from pathlib import Path
 from typing import (cast, Dict, Generator, List, Optional, Sequence, Tuple,
                     Union)
@@ -348,6 +349,28 @@ def __init__(self, path: Union[str, Path]) -> None:
         super().__init__(path, mode='rb')
         self.header = Header(path)
         self._channels = self.header.channels
+        self._max_samples = max(self.header.samples)
+        # cache per record sample counts & layout used on every read
+        self._spr = np.array(self.header.samples_per_record, dtype=np.int64)
+        self._spr_sum = int(self._spr.sum())
+        self._columns = [np.arange(sl.start, sl.stop) for sl in
+                         self.header.record_map]
+        self._slopes = self.header.slopes
+        self._offsets = self.header.offsets
+        # map the file so records are read from the page cache w/o copies
+        self._mm: Optional[mmap.mmap] = None
+        try:
+            self._mm = mmap.mmap(self._fobj.fileno(), 0,
+                                 access=mmap.ACCESS_READ)
+            # view the data section as num_records x sum(samples_per_record)
+            offset = self.header.header_bytes
+            nrecs = min(self.header.num_records,
+                        (len(self._mm) - offset) // (2 * self._spr_sum))
+            self._data = np.frombuffer(self._mm, '<i2', nrecs * self._spr_sum,
+                                       offset=offset).reshape(nrecs, -1)
+        except (ValueError, OSError):
+            self.close()
+            raise
 
     @property
     def channels(self) -> Sequence[int]:
@@ -376,12 +399,13 @@ def shape(self) -> Tuple[int, ...]:
         """Returns a 2-tuple containing the number of channels and
         number of samples in this EDF."""
 
-        return len(self.channels), max(self.header.samples)
+        return len(self.channels), self._max_samples
 
     def _decipher(self,
                   arr: np.ndarray,
                   channels: Sequence[int],
                   axis: int = -1,
+                  dtype: npt.DTypeLike = float,
     ):
         """Converts decoded data record integers to float voltages.
 
@@ -402,17 +426,20 @@ def _decipher(self,
                 a unique slope and offset.
             axis:
                 The samples axis of arr.
+            dtype:
+                The floating point datatype of the returned voltages.
 
         Returns:
-            A float64 ndarray of voltages with the same shape as 'arr'.
+            A dtype ndarray of voltages with the same shape as 'arr'.
         """
 
-        slopes = np.array(self.header.slopes[channels])
-        offsets = np.array(self.header.offsets[channels])
+        slopes = self._slopes[channels].astype(dtype, copy=False)
+        offsets = self._offsets[channels].astype(dtype, copy=False)
         #expand to 2-D for broadcasting
         slopes = np.expand_dims(slopes, axis=axis)
         offsets = np.expand_dims(offsets, axis=axis)
-        result = arr * slopes
+        # multiply allocates the only result array & the add is in-place
+        result = np.multiply(arr, slopes, dtype=dtype)
         result += offsets
         return cast(np.ndarray, result)
 
@@ -441,7 +468,7 @@ def _find_records(self,
             A list of (first, last) record numbers for each channel.
         """
 
-        spr = np.array(self.header.samples_per_record)[channels]
+        spr = self._spr[channels]
         starts = start // spr
         stops = np.ceil(stop / spr).astype('int')
         return list(zip(starts, stops))
@@ -465,19 +492,9 @@ def _records(self, a: int, b: int):
 
         if a >= self.header.num_records:
             return np.empty((1,0))
-        b = min(b, self.header.num_records)
-        cnt = b - a
 
-        self._fobj.seek(0)
-        #EDF samples are 2-byte little endian integers
-        bytes_per_record = sum(self.header.samples_per_record) * 2
-        #get offset in bytes & num samples spanning a to b
-        offset = self.header.header_bytes + a * bytes_per_record
-        nsamples = cnt * sum(self.header.samples_per_record)
-        #read records and reshape to num_records x sum(samples_per_record)
-        recs = np.fromfile(self._fobj, '<i2', nsamples, offset=offset)
-        arr = recs.reshape(cnt, sum(self.header.samples_per_record))
-        return arr
+        #view records in the mapped file; callers copy what they extract
+        return self._data[a:b]
 
     def _padstack(self,
                   arrs: Sequence[np.ndarray],
@@ -499,20 +516,48 @@ def _padstack(self,
         """
 
         longest = max(len(arr) for arr in arrs)
-        pad_sizes = np.array([longest - len(arr) for arr in arrs])
-
-        if all(pad_sizes == 0):
+        if all(len(arr) == longest for arr in arrs):
             return np.stack(arrs, axis=0)
 
-        x = [np.pad(arr.astype(float), (0, pad), constant_values=value)
-                for arr, pad in zip(arrs, pad_sizes)]
-        return np.stack(x, axis=axis)
+        # fill a single preallocated array with each arr & its padding
+        result = np.full((len(arrs), longest), value, dtype=float)
+        for row, arr in zip(result, arrs):
+            row[:len(arr)] = arr
+        return np.moveaxis(result, 0, axis)
+
+    def _gather(self,
+                arr: np.ndarray,
+                channels: Sequence[int],
+    ) -> np.ndarray:
+        """Gathers the samples of equal sample rate channels from records.
+
+        Args:
+            arr:
+                A 2-D array of records x sum(samples_per_record).
+            channels:
+                Sequence of channel indices with equal samples per record.
+
+        Returns:
+            A 2-D array of shape len(channels) x (records * spr).
+        """
+
+        cols = np.concatenate([self._columns[ch] for ch in channels])
+        if np.all(np.diff(cols) == 1):
+            # consecutive channels are a view of the records
+            arr = arr[:, cols[0]:cols[-1] + 1]
+        else:
+            arr = arr[:, cols]
+
+        # records x chs x spr -> chs x (records * spr)
+        arr = arr.reshape(arr.shape[0], len(channels), -1)
+        return arr.transpose(1, 0, 2).reshape(len(channels), -1)
 
     def _read_array(self,
                     start: int,
                     stop: int,
                     channels: Sequence[int],
                     padvalue: float,
+                    dtype: npt.DTypeLike = float,
     ):
         """Reads samples between start & stop indices for each channel index
         in channels.
@@ -527,16 +572,27 @@ def _read_array(self,
             padvalue:
                 Value to pad to channels that run out of data to return.
                 Only applicable if sample rates of channels differ.
+            dtype:
+                The floating point datatype of the returned array.
 
         Returns:
-            A float64 2-D array of shape len(channels) x (stop-start).
+            A dtype 2-D array of shape len(channels) x (stop-start).
         """
 
         # Locate record tuples that include start & stop samples for
         # each channel but only perform reads over unique record tuples.
         rec_tuples = self._find_records(start, stop, channels)
-        uniq_tuples = set(rec_tuples)
-        reads = {tup: self._records(*tup) for tup in uniq_tuples}
+        reads = {tup: self._records(*tup) for tup in set(rec_tuples)}
+
+        # channels with equal sample rates share records; gather at once
+        spr = self._spr[channels]
+        arr = reads[rec_tuples[0]]
+        if len(reads) == 1 and np.all(spr == spr[0]) and arr.size:
+
+            res = self._gather(arr, channels)
+            a = start - rec_tuples[0][0] * spr[0]
+            res = res[:, a:a + (stop - start)]
+            return self._decipher(res, channels, dtype=dtype)
 
         result=[]
         for ch, rec_tup in zip(channels, rec_tuples):
@@ -546,17 +602,17 @@ def _read_array(self,
             arr = arr[:, self.header.record_map[ch]].flatten()
 
             #adjust start & stop relative to records start pt
-            a = start - rec_tup[0] * self.header.samples_per_record[ch]
-            b = a + (stop - start)
-            result.append(arr[a:b])
+            a = start - rec_tup[0] * self._spr[ch]
+            result.append(arr[a:a + (stop - start)])
 
         res = self._padstack(result, padvalue)
-        return self._decipher(res, channels)
+        return self._decipher(res, channels, dtype=dtype)
 
     def read(self,
              start: int,
              stop: Optional[int] = None,
-             padvalue: float = np.NaN
+             padvalue: float = np.NaN,
+             dtype: npt.DTypeLike = float,
     ) -> npt.NDArray[np.float64]:
         """Reads samples from this EDF from this Reader's channels.
 
@@ -569,21 +625,36 @@ def read(self,
             padvalue:
                 Value to pad to channels that run out of samples to return.
                 Only applicable if sample rates of channels differ.
+            dtype:
+                The floating point datatype of the returned samples.
+                Default is float64. EDF samples are 16-bit integers mapped
+                linearly to voltages, so np.float32 represents them to
+                within 1 part in 2**24 of their range while halving the
+                memory of the returned array.
 
         Returns:
-            A float64 array of shape len(chs) x (stop-start) samples.
+            A dtype array of shape len(chs) x (stop-start) samples.
         """
 
-        if start > max(self.header.samples):
-            return np.empty((len(self.channels), 0))
+        if start > self._max_samples:
+            return np.empty((len(self.channels), 0), dtype=dtype)
 
         if not stop:
-            stop = max(self.header.samples)
+            stop = self._max_samples
 
-        arr = self._read_array(start, stop, self.channels, padvalue)
+        arr = self._read_array(start, stop, self.channels, padvalue, dtype)
         # use cast to indicate ndarray type for docs
         return cast(np.ndarray, arr)
 
+    def close(self):
+        """Close this reader instance's memory map and opened file object."""
+
+        # the data view must be released before its map can close
+        self._data = None
+        if self._mm is not None:
+            self._mm.close()
+        super().close()
+
 
 # Writer groups logically related non-public methods.
 # pylint: disable-next=too-few-public-methods
@@ -626,8 +697,12 @@ def _write_header(self, header: Header) -> None:
         """
 
         # the header should be added during write not initialization
-        # pylint: disable-next=attribute-defined-outside-init
+        # pylint: disable=attribute-defined-outside-init
         self.header = header
+        # cache the digital mapping used to encipher every record
+        self._offsets = header.offsets
+        self._inv_slopes = 1 / header.slopes
+        # pylint: enable=attribute-defined-outside-init
         bytemap = header.bytemap(header.num_signals)
 
         # Move to file start and write each ascii encoded byte string
@@ -657,44 +732,70 @@ def _records(self,
             for a single data record.
         """
 
-        for n in range(self.header.num_records):
-            result = []
-            # The number of samples per record is channel dependent if
-            # sample rates are not equal across channels.
-            starts = n * np.array(self.header.samples_per_record)
-            stops = (n+1) * np.array(self.header.samples_per_record)
-
-            for channel, start, stop in zip(channels, starts, stops):
-                if isinstance(data, np.ndarray):
-                    x = np.atleast_2d(data[channel][start:stop])
-                    result.append(x)
-                    #result.append(data[channel][start:stop])
-                else:
-                    data.channels = [channel]
-                    result.append(data.read(start, stop))
-
-            yield result
+        # The number of samples per record is channel dependent if
+        # sample rates are not equal across channels.
+        spr = np.array(self.header.samples_per_record)
+        # a Reader's channels are restored once all records are yielded
+        initial = data.channels if isinstance(data, Reader) else []
+        try:
+            # equal rate channels are read from a Reader at once per record
+            if isinstance(data, Reader) and np.all(spr == spr[0]):
+
+                data.channels = list(channels)
+                for n in range(self.header.num_records):
+                    arr = data.read(n * spr[0], (n+1) * spr[0])
+                    yield [arr[idx:idx+1] for idx in range(len(channels))]
+                return
+
+            for n in range(self.header.num_records):
+                result = []
+                starts = n * spr
+                stops = (n+1) * spr
+
+                for channel, start, stop in zip(channels, starts, stops):
+                    if isinstance(data, np.ndarray):
+                        x = np.atleast_2d(data[channel][start:stop])
+                        result.append(x)
+                        #result.append(data[channel][start:stop])
+                    else:
+                        data.channels = [channel]
+                        result.append(data.read(start, stop))
+
+                yield result
+
+        finally:
+            if isinstance(data, Reader):
+                data.channels = initial
 
     def _encipher(self, arrs: Sequence):
-        """Converts float arrays to 2-byte little-endian integer arrays
-        using the EDF specification.
+        """Converts float arrays to a data record of 2-byte little-endian
+        integers using the EDF specification.
 
         Args:
             arrs:
-                A sequence of 1-D arrays of float dtype.
+                A sequence of single row 2-D arrays of float dtype, one per
+                channel of the record.
 
         Returns:
-            A sequence of 1-D arrays in 2-byte little-endian format.
+            A single row 2-D array in 2-byte little-endian format of all
+            channels in arrs concatenated. Values outside the 2-byte
+            integer range are clipped.
         """
 
-        slopes = self.header.slopes
-        offsets = self.header.offsets
-        results = []
+        limits = np.iinfo('<i2')
+        record = np.empty((1, sum(x.shape[-1] for x in arrs)), dtype='<i2')
+        start = 0
         for ch, x in enumerate(arrs):
-            arr = np.rint((x - offsets[ch]) / slopes[ch])
-            arr = arr.astype('<i2')
-            results.append(arr)
-        return results
+            # one temporary array is mapped, rounded & clipped in-place
+            arr = np.subtract(x, self._offsets[ch], dtype=float)
+            arr *= self._inv_slopes[ch]
+            np.rint(arr, out=arr)
+            np.clip(arr, limits.min, limits.max, out=arr)
+            # cast directly into this channel's place in the record
+            stop = start + arr.shape[-1]
+            np.copyto(record[:, start:stop], arr, casting='unsafe')
+            start = stop
+        return record
 
     def _validate(self, header: Header, data: np.ndarray) -> None:
         """Ensures the number of samples is divisible by the number of
@@ -762,10 +863,8 @@ def write(self,
         self._fobj.seek(header.header_bytes)
         for idx, record in enumerate(self._records(data, channels)):
             samples = self._encipher(record) # floats to '<i2'
-            samples = np.concatenate(samples, axis=1)
-            #concatenate data bytes to str and write
-            byte_str = samples.tobytes()
-            self._fobj.write(byte_str)
+            #write the contiguous record's buffer without a bytes copy
+            self._fobj.write(samples.data)
             if verbose:
                 self._progress(idx)
 
@@ -3,17 +3,54 @@
 """
 
 import abc
-from functools import partial
-from typing import Optional, Sequence, Tuple, Union
+from functools import lru_cache, partial
+from typing import Optional, Sequence, Tuple, Union, cast
 
 import numpy as np
+import numpy.typing as npt
 import scipy.signal as sps
+from scipy import ndimage
 from openseize.core import mixins
 from openseize.core import numerical as nm
-from openseize.core.producer import Producer, producer
+from openseize.core.arraytools import slice_along_axis
+from openseize.core.producer import Producer, as_producer, producer
 from openseize.filtering.mixins import FIRViewer, IIRViewer
 
 
+@as_producer
+def _astype(pro, dtype):
+    """Yields each array of a producer cast to dtype."""
+
+    for arr in pro:
+        yield arr.astype(dtype, copy=False)
+
+
+@lru_cache(maxsize=128)
+def _firwin(numtaps, cutoff, window, btype, fs):
+    """Returns the cached coeffecients of a windowed FIR.
+
+    Args:
+        numtaps: int
+            The number of filter coeffecients.
+        cutoff: tuple
+            The -6 dB frequencies of each transition band.
+        window: tuple
+            A scipy window name followed by any window parameters.
+        btype: str
+            One of 'lowpass', 'highpass', 'bandpass' or 'bandstop'.
+        fs: int
+            The sampling rate of the digital system.
+
+    Returns: A read-only 1-D array of numtaps coeffecients.
+    """
+
+    coeffs = sps.firwin(numtaps, cutoff=cutoff, width=None, window=window,
+                        pass_zero=btype, scale=True, fs=fs)
+    coeffs.flags.writeable = False
+
+    return coeffs
+
+
 class IIR(abc.ABC, IIRViewer, mixins.ViewInstance):
     """Base class for infinite impulse response filters.
 
@@ -336,15 +373,74 @@ def _build(self, **kwargs):
 
         # get the window from this FIRs name and ask for add. params
         window = (self.ftype, *self.window_params)
-        return sps.firwin(self.numtaps, cutoff=self.cutoff, width=None,
-                          window=window, pass_zero=self.btype,
-                          scale=True, fs=self.fs, **kwargs)
+        if kwargs:
+            return sps.firwin(self.numtaps, cutoff=self.cutoff, width=None,
+                              window=window, pass_zero=self.btype,
+                              scale=True, fs=self.fs, **kwargs)
+
+        # identical designs reuse cached coeffs; copy so each filter owns
+        # its coeffs
+        cutoff = tuple(self.cutoff.tolist())
+        return _firwin(self.numtaps, cutoff, window, self.btype,
+                       self.fs).copy()
+
+    def _convolve_direct(self,
+                         arr: np.ndarray,
+                         axis: int,
+                         mode: str,
+                         dtype: npt.DTypeLike = float,
+    ) -> np.ndarray:
+        """Convolves this FIR's coeffecients with an in-memory array in the
+        time domain.
+
+        For windows of up to a few dozen taps this is faster than the
+        overlap-add FFT method. Scipy's choose_conv_method is not used to
+        select between the methods since its cost model compares direct
+        against whole-array FFT convolution and favors direct convolution
+        well past the point where batched overlap-add is faster.
+
+        Args:
+            arr:
+                An ndarray to filter.
+            axis:
+                The axis of arr along which to apply the filter.
+            mode:
+                A numpy convolve mode; one of 'full', 'same', 'valid'.
+            dtype:
+                The floating point datatype of the convolution.
+
+        Returns:
+            A float ndarray with mode applied along axis.
+        """
+
+        window = self.coeffs.astype(dtype, copy=False)
+        m, n = len(window), arr.shape[axis]
+        # convolve1d computes same mode samples starting at (m-1)//2
+        offset = (m - 1) // 2
+
+        if mode == 'full':
+            # zero extend so same mode of extended arr is full mode of arr
+            pads = [(0, 0)] * arr.ndim
+            pads[axis] = (offset, m // 2)
+            arr = np.pad(arr, pads)
+
+        # shift even len. windows to match numpy's same mode centering
+        result = ndimage.convolve1d(arr, window, axis=axis, output=dtype,
+                                    mode='constant', origin=m % 2 - 1)
+
+        if mode == 'valid':
+            start = m - 1 - offset
+            result = slice_along_axis(result, start, n - offset, axis=axis)
+
+        # use cast to indicate ndarray type for docs
+        return cast(np.ndarray, result)
 
     def __call__(self,
                  data: Union[Producer, np.ndarray],
                  chunksize: int,
                  axis: int = -1,
                  mode: str = 'same',
+                 dtype: Optional[npt.DTypeLike] = None,
                  **kwargs) -> Union[Producer, np.ndarray]:
         """Apply this filter to an ndarray or producer of ndarrays.
 
@@ -373,6 +469,12 @@ def __call__(self,
                     data completely overlap. The result using this mode
                     is to shift the data (num_taps - 1) / 2 samples to
                     the left of the input data.
+            dtype:
+                The floating point datatype in which data is filtered. If
+                None (Default), data is filtered in double precision.
+                Single precision (np.float32) halves the memory and FFT
+                work of filtering and is sufficient for data digitized
+                with 24 or fewer bits.
             kwargs:
                 Any valid keyword argument for the producer constructor.
 
@@ -380,11 +482,19 @@ def __call__(self,
             Filtered result with type matching input 'data' parameter.
         """
 
-        pro = producer(data, chunksize, axis, **kwargs)
-        window = self.coeffs
+        dtype = float if dtype is None else dtype
+        window = self.coeffs.astype(dtype, copy=False)
+
+        # short windows are faster to convolve directly for in-memory data
+        if isinstance(data, np.ndarray) and not kwargs and len(window) <= 32:
+            return self._convolve_direct(data, axis, mode, dtype)
+
+        # cast each produced array at the boundary of the filter so the
+        # precision is set by dtype alone and never by the data
+        pro = _astype(producer(data, chunksize, axis, **kwargs), dtype)
 
         # construct overlap-add generating function & get resultant shape
-        genfunc = partial(nm.oaconvolve, pro, self.coeffs, axis, mode)
+        genfunc = partial(nm.oaconvolve, pro, window, axis, mode)
         shape = nm.convolved_shape(data.shape, window.shape, mode, axis)
 
         # build producer from generating func.
@@ -393,7 +503,63 @@ def __call__(self,
         # return array if input data is array
         if isinstance(data, np.ndarray):
             # pylint incorrectly believes result is a generator
-            result = result.to_array() # pylint: disable=no-member
+            result = result.to_array(dtype) # pylint: disable=no-member
 
 
         return result
+
+    def decimate(self,
+                 data: Union[Producer, np.ndarray],
+                 M: int,
+                 chunksize: int,
+                 axis: int = -1,
+    ) -> Union[Producer, np.ndarray]:
+        """Apply this filter to an ndarray or producer of ndarrays keeping
+        only every Mth filtered sample.
+
+        The filtered samples that do not survive decimation are never
+        computed. This is equivalent to but much faster than slicing every
+        Mth sample from this filter's 'same' mode result.
+
+        Args:
+            data:
+                The data to be filtered and decimated.
+            M:
+                The decimation factor describing which Mth filtered samples
+                survive decimation. (E.g. M=10 -> every 10th survives)
+            chunksize:
+                The number of samples to hold in memory during filtering.
+                This method will require ~ 3 times chunksize in memory.
+                Chunksizes smaller than this filter's length are enlarged
+                to the filter's length.
+            axis:
+                The axis of data along which to filter and decimate.
+
+        Returns:
+            Filtered & decimated result with type matching input 'data'
+            parameter.
+
+        Raises:
+            ValueError: data is less than 3 times this filter's length
+                along axis.
+        """
+
+        # chunks must cover this filter's overhang into neighboring chunks
+        chunksize = max(chunksize, len(self.coeffs))
+        pro = producer(data, chunksize, axis)
+
+        # polyphase decimation with this filter's coeffecients
+        genfunc = partial(nm.polyphase_resample, pro, 1, M, self.fs, self,
+                          axis)
+        shape = list(pro.shape)
+        shape[axis] = int(np.ceil(pro.shape[axis] / M))
+
+        # build producer from generating func.
+        result = producer(genfunc, chunksize, axis, shape=tuple(shape))
+
+        # return array if input data is array
+        if isinstance(data, np.ndarray):
+            # pylint incorrectly believes result is a generator
+            result = result.to_array() # pylint: disable=no-member
+
+        return result
@@ -45,7 +45,7 @@
         ((5001,), (3776,), (4, 5001, 3776))
 """
 
-from typing import Tuple, Union
+from typing import Optional, Tuple, Union, cast
 
 import numpy as np
 import numpy.typing as npt
@@ -63,7 +63,8 @@ def psd(data: Union[npt.NDArray[np.float64], Producer],
         window: str = 'hann',
         overlap: float = 0.5,
         detrend: str = 'constant',
-        scaling: str = 'density'
+        scaling: str = 'density',
+        dtype: Optional[npt.DTypeLike] = None,
 ) -> Tuple[int, npt.NDArray[np.float64], npt.NDArray[np.float64]]:
     """A power spectrum (density) estimator using Welch's method.
 
@@ -100,6 +101,12 @@ def psd(data: Union[npt.NDArray[np.float64], Producer],
             Determines the normalization to apply to the estimate. If
             'spectrum' the estimate will have units V^2 and if 'density'
             V^2 / Hz.
+        dtype:
+            The floating point datatype in which each segment is estimated.
+            If None (Default), segments are estimated in double precision
+            (np.float64). Single precision (np.float32) halves the memory and
+            FFT work of the estimate. Segment estimates are always averaged
+            in double precision.
 
     Returns:
         A tuple (n, frequencies, estimate) where:
@@ -108,6 +115,9 @@ def psd(data: Union[npt.NDArray[np.float64], Producer],
          - frequencies is a 1D array at which the PSD was estimated
          - estimate is a 2-D array of PSD estimates one per channel.
 
+    Raises:
+        ValueError: data has fewer than fs // resolution samples along axis.
+
     Examples:
         >>> # import demo data and make a producer
         >>> from openseize.demos import paths
@@ -142,18 +152,12 @@ def psd(data: Union[npt.NDArray[np.float64], Producer],
     # convert requested resolution to DFT pts
     nfft = int(fs / resolution)
 
-    # build a producer of psd estimates, one per welch segment & store
-    freqs, psd_pro = nm.welch(pro, fs, nfft, window, overlap, axis, detrend,
-                              scaling)
-
-    # compute the average PSD estimate
-    result = 0
-    for cnt, arr in enumerate(psd_pro, 1):
-        result = result + 1 / cnt * (arr - result)
-
-    # pylint misses the cnt variable here
-    #pylint: disable-next=undefined-loop-variable
-    return cnt, freqs, result #type: ignore
+    # average the welch estimates of each block of segments
+    result = nm.welch_mean(pro, fs, nfft, window, overlap, axis, detrend,
+                           scaling, dtype)
+    # use cast to indicate return types for docs
+    return cast(Tuple[int, npt.NDArray[np.float64], npt.NDArray[np.float64]],
+                result)
 
 
 # pylint: disable-next=too-many-arguments,too-many-locals
@@ -247,6 +251,10 @@ def stft(data: Union[npt.NDArray[np.float64], Producer],
             length of the time axis will be nfft-overlap * nfft + 1 samples
             along axis where nfft = fs // resolution.
 
+    Raises:
+        ValueError: data is shorter than a single fs // resolution segment
+            after any boundary and padding extension.
+
     Examples:
         >>> # import demo data and make a producer
         >>> from openseize.demos import paths
@@ -280,6 +288,13 @@ def stft(data: Union[npt.NDArray[np.float64], Producer],
     if asarray:
 
         if is_assignable(result):
-            result = np.stack(list(result), axis=-1)
+
+            # place each segment's estimate into a preallocated array
+            shape = list(result.shape)
+            nsegs, shape[axis] = shape[axis], len(freqs)
+            out = np.empty(shape + [nsegs], dtype=complex)
+            for idx, arr in enumerate(result):
+                out[..., idx] = arr
+            result = out
 
     return freqs, time, result
@@ -71,13 +71,9 @@ def power(psd: npt.NDArray[np.float64],
         This metric should only be used on data that is density scaled.
     """
 
-    if start is None:
-        start = freqs[0]
-    if stop is None:
-        stop = freqs[-1]
-
-    # compute start and stop frequency indices
-    a, b = nearest1D(freqs, start), nearest1D(freqs, stop)
+    # compute start and stop frequency indices; None is a band edge
+    a = 0 if start is None else nearest1D(freqs, start)
+    b = len(freqs) - 1 if stop is None else nearest1D(freqs, stop)
 
     # slice between freq indices inclusively & integrate
     arr = slice_along_axis(psd, start=a, stop=b+1, axis=axis)
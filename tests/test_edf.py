@@ -144,6 +144,19 @@ def test_random_reads_chs(demo_data):
     pyeeg.close()
     openeeg.close()
 
+def test_read_float32(demo_data):
+    """Test if single precision reads match double precision reads."""
+
+    openeeg = openEDF(demo_data)
+
+    start = np.random.randint(0, 5e6)
+    arr = openeeg.read(start, start + 10000, dtype=np.float32)
+    other = openeeg.read(start, start + 10000)
+    assert arr.dtype == np.float32
+    assert np.allclose(arr, other, rtol=1e-6, atol=1e-4)
+
+    openeeg.close()
+
 def test_read_EOF(demo_data):
     """Test if start sample is at EOF that reader returns an empty array."""
 
@@ -202,6 +215,57 @@ def test_written_data(demo_data, written_data):
         other = openeeg2.read(start, stop)
         assert np.allclose(arr[[0, 3],:], other)
 
+def test_written_clipped(demo_data, tmp_path):
+    """Test that samples outside the physical range of the header are
+    written clipped to that range."""
+
+    channels = [0, 1]
+    nrecords, spr = 4, 100
+    with openEDF(demo_data) as reader:
+        header = reader.header.filter(channels)
+    header['num_records'] = nrecords
+    header['samples_per_record'] = [spr] * len(channels)
+
+    # samples spanning twice the physical range of each channel
+    rng = np.random.default_rng(0)
+    x = rng.uniform(-16000, 16000, size=(len(channels), nrecords * spr))
+    x[:, :2] = [-1e9, 1e9]
+
+    fp = tmp_path.joinpath('clip_test.edf')
+    with openWriter(fp) as writer:
+        writer.write(header, x, channels=channels, verbose=False)
+
+    with openEDF(fp) as reader:
+        y = reader.read(0)
+        slopes = reader.header.slopes
+
+    expected = np.clip(x, header['physical_min'][0],
+                       header['physical_max'][0])
+    assert np.all(np.isfinite(y))
+    assert np.allclose(y, expected, atol=max(slopes))
+
+
+def test_written_restores_channels(irregular_written_data, tmp_path):
+    """Test that writing from a Reader with equal and with mixed sample
+    rate channels restores the Reader's channels."""
+
+    path, _ = irregular_written_data
+    fp = tmp_path.joinpath('channels_test.edf')
+    with openEDF(path) as reader:
+
+        header = openHeader.from_dict(reader.header)
+        header['num_records'] = 4
+        initial = reader.channels
+
+        # channels 0 & 3 share a sample rate that differs from channel 1
+        for channels in ([0, 3], [0, 1]):
+            with openWriter(fp) as writer:
+                writer.write(header, reader, channels=channels,
+                             verbose=False)
+
+            assert reader.channels == initial
+
+
 #################################
 # IRREGULAR DATA READ AND WRITE #
 #################################
@@ -0,0 +1,133 @@
+"""A module for testing openseize's FIR filters.
+
+Typical usage example:
+    !pytest fir_tests.py::<TEST_NAME>
+"""
+
+import numpy as np
+import scipy.signal as sps
+
+from openseize import producer
+from openseize.filtering import bases, fir
+
+
+def test_fir_modes_arrs():
+    """Compares each mode's result of openseize FIR filters applied to
+    arrays against scipy's direct convolution for short and long filters."""
+
+    rng = np.random.default_rng(0)
+    arr = rng.random((3, 61277))
+
+    # transition widths giving short (direct) & long (overlap-add) filters
+    for fpass, fstop in [(500, 1500), (500, 600)]:
+
+        filt = fir.Kaiser(fpass, fstop, fs=5000, gpass=1, gstop=40)
+        window = np.expand_dims(filt.coeffs, 0)
+
+        for mode in ('full', 'same', 'valid'):
+
+            result = filt(arr, chunksize=10000, axis=-1, mode=mode)
+            expected = sps.convolve(arr, window, mode=mode, method='direct')
+
+            assert np.allclose(result, expected)
+
+
+def test_fir_decimate():
+    """Compares openseize FIR decimation against slicing every Mth sample
+    from scipy's same mode convolution."""
+
+    rng = np.random.default_rng(1)
+    arr = rng.random((2, 53011))
+
+    filts = [fir.Kaiser(400, 500, fs=5000, gpass=1, gstop=40),
+             fir.Hann([300, 800], [200, 900], fs=5000)]
+
+    for filt in filts:
+
+        window = np.expand_dims(filt.coeffs, 0)
+        convolved = sps.convolve(arr, window, mode='same')
+
+        for M in (2, 3, 10):
+
+            result = filt.decimate(arr, M, chunksize=10000, axis=-1)
+            assert np.allclose(result, convolved[:, ::M])
+
+
+def test_fir_decimate_short_chunks():
+    """Compares openseize FIR decimation using chunksizes shorter than the
+    filter against slicing every Mth sample from scipy's same mode
+    convolution."""
+
+    rng = np.random.default_rng(3)
+    filt = fir.Kaiser(100, 110, fs=5000)
+    window = np.expand_dims(filt.coeffs, 0)
+
+    for nsamples in (5000, 20011):
+
+        arr = rng.standard_normal((2, nsamples))
+        convolved = sps.convolve(arr, window, mode='same')
+
+        for chunksize in (300, 1000):
+
+            result = filt.decimate(arr, 3, chunksize=chunksize, axis=-1)
+            assert np.allclose(result, convolved[:, ::3])
+
+
+def test_fir_float32():
+    """Validates that FIR filtering in single precision returns float32
+    results close to double precision filtering of integer data."""
+
+    rng = np.random.default_rng(2)
+    arr = rng.integers(-2**15, 2**15, size=(3, 41017), dtype=np.int16)
+
+    # transition widths giving short (direct) & long (overlap-add) filters
+    for fpass, fstop in [(500, 1500), (500, 600)]:
+
+        filt = fir.Kaiser(fpass, fstop, fs=5000, gpass=1, gstop=40)
+        result = filt(arr, chunksize=10000, axis=-1, dtype=np.float32)
+        expected = filt(arr, chunksize=10000, axis=-1)
+
+        assert result.dtype == np.float32
+        assert np.allclose(result, expected, rtol=1e-4, atol=1e-2)
+
+
+def test_fir_float32_default():
+    """Validates that float32 data is filtered in double precision unless
+    single precision is requested."""
+
+    rng = np.random.default_rng(4)
+    arr = rng.standard_normal((3, 50000)).astype(np.float32)
+
+    # transition widths giving short (direct) & long (overlap-add) filters
+    for fpass, fstop in [(500, 1500), (500, 600)]:
+
+        filt = fir.Kaiser(fpass, fstop, fs=5000)
+        result = filt(arr, chunksize=10000, axis=-1)
+        expected = filt(arr.astype(float), chunksize=10000, axis=-1)
+
+        assert result.dtype == np.float64
+        assert np.array_equal(result, expected)
+
+        pro = producer(arr, chunksize=10000, axis=-1)
+        assert all(x.dtype == np.float64 for x in filt(pro, 10000, axis=-1))
+
+
+def test_fir_cached_coeffs():
+    """Validates that cached FIR coeffecients are read-only and that each
+    filter owns a writeable copy of them."""
+
+    filt = fir.Kaiser(400, 500, fs=5000, gpass=1, gstop=40)
+    other = fir.Kaiser(400, 500, fs=5000, gpass=1, gstop=40)
+
+    window = (filt.ftype, *filt.window_params)
+    cutoff = tuple(filt.cutoff.tolist())
+    cached = bases._firwin(filt.numtaps, cutoff, window, filt.btype, filt.fs)
+
+    assert not cached.flags.writeable
+    assert np.array_equal(filt.coeffs, cached)
+
+    for coeffs in (filt.coeffs, other.coeffs):
+        assert coeffs.flags.writeable
+        assert not np.shares_memory(coeffs, cached)
+
+    assert not np.shares_memory(filt.coeffs, other.coeffs)
@@ -11,6 +11,22 @@
 from openseize import producer
 from openseize.core import numerical as nm
 
+def test_optimal_nffts():
+    """Validates that the estimated nffts are 5-smooth sizes that cover 8
+    times the window length without exceeding the next power of 2."""
+
+    for wlen in [3, 101, 127, 255, 1001, 4097, 10001]:
+
+        nfft = nm.optimal_nffts(np.ones(wlen))
+        assert 8 * wlen <= nfft <= 2**int(np.ceil(np.log2(8 * wlen)))
+
+        # nfft must factor into only 2, 3 & 5
+        for p in (2, 3, 5):
+            while nfft % p == 0:
+                nfft //= p
+        assert nfft == 1
+
+
 def test_oaconvolve_pros():
     """Compares openseize's overlap-add convolve against scipy for
     arrays/producers that vary in size along the last axis."""
@@ -94,6 +110,52 @@ def test_oaconvolve_windows():
             assert np.allclose(osz_result, sp_result)
 
 
+def test_oaconvolve_batched():
+    """Compares openseize's overlap-add convolve against scipy when the
+    producer's chunksize spans many overlap-add segments."""
+
+    rng = np.random.default_rng(33)
+    axis = 1
+    arr = rng.random((2, 301127, 3))
+    window = sps.get_window('hann', 101)
+
+    for mode in ('full', 'same', 'valid'):
+
+        # chunksize much larger than nfft forces batched segment FFTs
+        pro = producer(arr, chunksize=100000, axis=axis)
+        osz_gen = nm.oaconvolve(pro, window, axis=axis, mode=mode,
+                                nfft_factor=2)
+        osz_result = np.concatenate([x for x in osz_gen], axis=axis)
+
+        win = np.expand_dims(window, (0, 2))
+        sp_result = sps.oaconvolve(arr, win, axes=axis, mode=mode)
+
+        assert np.allclose(osz_result, sp_result)
+
+
+def test_oaconvolve_float32():
+    """Validates that openseize's overlap-add convolve preserves single
+    precision data and matches scipy's double precision result."""
+
+    rng = np.random.default_rng(34)
+    axis = -1
+    arr = rng.random((3, 52311)).astype(np.float32)
+    window = sps.get_window('hamming', 77)
+
+    for mode in ('full', 'same', 'valid'):
+
+        pro = producer(arr, chunksize=10000, axis=axis)
+        osz_gen = nm.oaconvolve(pro, window, axis=axis, mode=mode)
+        osz_result = np.concatenate([x for x in osz_gen], axis=axis)
+
+        win = np.expand_dims(window, 0)
+        sp_result = sps.oaconvolve(arr.astype(float), win, axes=axis,
+                                   mode=mode)
+
+        assert osz_result.dtype == np.float32
+        assert np.allclose(osz_result, sp_result, rtol=1e-4, atol=1e-4)
+
+
 
 
 
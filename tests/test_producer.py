@@ -30,7 +30,7 @@ def test_fromarray():
     for (start, stop), pro_arr in zip(segments, pro):
         slicer = [slice(None)] * arr.ndim #slice obj to slice arr
         slicer[-1] = slice(start, stop)
-        assert np.allclose(arr[tuple(slicer)], pro_arr)
+        assert np.array_equal(arr[tuple(slicer)], pro_arr)
 
 def test_frommaskedarray():
     """Test if a producer from arrays with a mask produces correct subarrays
@@ -52,7 +52,7 @@ def test_frommaskedarray():
     for (start, stop), pro_arr in zip(segments, pro):
         slicer = [slice(None)] * masked.ndim #slice obj to slice arr
         slicer[-1] = slice(start, stop)
-        assert np.allclose(masked[tuple(slicer)], pro_arr)
+        assert np.array_equal(masked[tuple(slicer)], pro_arr)
 
 def test_fromsequence():
     """Verify that a producer built from a sequence of arrays produces the
@@ -72,7 +72,7 @@ def test_fromsequence():
     for (start, stop), pro_arr in zip(segments, pro):
         slicer = [slice(None)] * arr.ndim #slice obj to slice arr
         slicer[1] = slice(start, stop)
-        assert np.allclose(arr[tuple(slicer)], pro_arr)
+        assert np.array_equal(arr[tuple(slicer)], pro_arr)
 
 def test_fromgenerator0():
     """Verify that a producer built from a generator function yielding
@@ -100,7 +100,7 @@ def g(arrs):
     for (start, stop), pro_arr in zip(segments, pro):
         slicer = [slice(None)] * arr.ndim #slice obj to slice arr
         slicer[0] = slice(start, stop)
-        assert np.allclose(arr[tuple(slicer)], pro_arr)
+        assert np.array_equal(arr[tuple(slicer)], pro_arr)
 
 def test_fromgenerator1():
     """Test if a producer with a chunksize that is a multiple of the array
@@ -147,7 +147,7 @@ def g(chs=chs, samples=samples, segsize=gensize):
     for (start, stop), pro_arr in zip(segments, pro):
         slicer = [slice(None)] * arr.ndim #slice obj to slice arr
         slicer[-1] = slice(start, stop)
-        assert np.allclose(arr[tuple(slicer)], pro_arr)
+        assert np.array_equal(arr[tuple(slicer)], pro_arr)
 
 def test_frommaskedgenerator0():
     """Verify that a producer from a generator of arrays with a mask
@@ -179,7 +179,7 @@ def g(arrs):
     for idx, ((start, stop), pro_arr) in enumerate(zip(segments, pro)):
         slicer = [slice(None)] * arr.ndim #slice obj to slice arr
         slicer[0] = slice(start, stop)
-        assert np.allclose(masked[tuple(slicer)], pro_arr)
+        assert np.array_equal(masked[tuple(slicer)], pro_arr)
 
 def test_frommaskedgenerator1():
     """Verify that a producer from a generator of arrays with a mask
@@ -232,7 +232,7 @@ def g(chs=chs, samples=samples, segsize=gensize):
     for (start, stop), pro_arr in zip(segments, pro):
         slicer = [slice(None)] * arr.ndim #slice obj to slice arr
         slicer[-1] = slice(start, stop)
-        assert np.allclose(masked[tuple(slicer)], pro_arr)
+        assert np.array_equal(masked[tuple(slicer)], pro_arr)
 
 def test_fromreader(demo_data):
     """Verifies that a producer from an EDF file reader produces the correct
@@ -377,7 +377,7 @@ def test_padproducer0():
         padded = pad_producer(pro, [l, r], value=0)
         padded = np.concatenate([x for x in padded], axis=-1)
 
-        assert np.allclose(padded[:, l:-r], arr)
+        assert np.array_equal(padded[:, l:-r], arr)
 
 def test_padproducer1():
     """Test that pad_producer produces the correct padded sequence of
@@ -394,4 +394,27 @@ def test_padproducer1():
         padded = np.concatenate([x for x in padded], axis=axis)
         probe = slice_along_axis(padded, start=amt, stop=-amt, axis=axis)
         
-        assert np.allclose(probe, arr)
+        assert np.array_equal(probe, arr)
+
+
+def test_to_array():
+    """Test that to_array keeps the produced datatype unless a dtype is
+    given and raises an error if produced arrays exceed the shape."""
+
+    rng = np.random.default_rng(seed=0)
+    arr = rng.integers(-2**15, 2**15, size=(3, 10013), dtype=np.int16)
+
+    pro = producer(arr, chunksize=1000, axis=-1)
+    result = pro.to_array()
+    assert result.dtype == np.int16
+    assert np.array_equal(result, arr)
+    assert pro.to_array(dtype=float).dtype == np.float64
+
+    def g():
+        """Generating function yielding more samples than its shape."""
+
+        yield from (arr for _ in range(2))
+
+    pro = producer(g, chunksize=1000, axis=-1, shape=arr.shape)
+    with pytest.raises(ValueError):
+        pro.to_array()
@@ -139,3 +139,23 @@ def test_LM1():
     assert np.allclose(x, rarr)
 
 
+
+
+def test_short_chunks():
+    """Test if resampling with chunks shorter than the filter's overhang
+    matches scipy resample and that too short arrays raise an error."""
+
+    fs = 5000
+    L, M = 1, 10
+    h = resample_filter(L, M, fs)
+
+    for nsamples, chunksize in itertools.product([5000, 5003], [50, 300]):
+
+        rarr = random_arr(shape=(2, nsamples))
+        x = resample(rarr, L=L, M=M, fs=fs, chunksize=chunksize, axis=-1)
+        y = sps.resample_poly(rarr, up=L, down=M, axis=-1, window=h)
+
+        assert np.allclose(x, y)
+
+    with pytest.raises(ValueError):
+        resample(random_arr(shape=(2, 300)), L, M, fs=fs, chunksize=50)
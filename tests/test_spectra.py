@@ -11,7 +11,7 @@
 from openseize import producer
 from openseize.core.numerical import periodogram, welch
 from openseize.filtering.fir import Kaiser
-from openseize.spectra.estimators import stft
+from openseize.spectra.estimators import psd, stft
 
 def test_periodogram_arrs():
     """Test if the openseize periodogram function matches scipy's peridogram
@@ -77,6 +77,34 @@ def test_periodogram_nfft():
         assert np.allclose(op_res, sp_res)
 
 
+def test_periodogram_detrend():
+    """Test if openseize periodogram result matches scipy result for linear
+    detrending along a non-final axis."""
+
+    rng = np.random.default_rng(1234)
+    arr = rng.random((3, 13202, 4)) + np.linspace(0, 5, 13202)[:, None]
+
+    # periodogram parameters
+    fs = 6000
+    nfft = None
+    window='hann'
+    detrend = 'linear'
+    scaling = 'density'
+    return_onesided=True
+    axis = 1
+
+    # openseize result
+    op_f, op_res = periodogram(arr, fs, nfft, window, axis, detrend, 
+                               scaling) 
+
+    # scipy result
+    sp_f, sp_res = sps.periodogram(arr, fs, window, nfft, detrend,
+                                   return_onesided, scaling, axis)
+
+    assert np.allclose(op_f, sp_f)
+    assert np.allclose(op_res, sp_res)
+
+
 def test_periodogram_windows():
     """Test if openseize periodogram result matches scipy result for various
     scipy signal windows."""
@@ -329,6 +357,80 @@ def test_welch_scaling():
         assert np.allclose(op_res, sp_res)
 
 
+def test_psd():
+    """Test if a default precision openseize psd matches scipy's welch
+    result."""
+
+    rng = np.random.default_rng(1234)
+    arr = rng.random((3, 4, 132026))
+
+    # psd parameters
+    fs = 1000
+    resolution = 1
+    overlap = 0.5
+    axis = -1
+
+    _, op_f, op_res = psd(arr, fs, axis, resolution, overlap=overlap)
+
+    sp_f, sp_res = sps.welch(arr, fs=fs, nperseg=int(fs / resolution),
+                             noverlap=int(overlap * fs / resolution),
+                             axis=axis)
+
+    assert op_res.dtype == np.float64
+    assert np.allclose(op_f, sp_f)
+    assert np.allclose(op_res, sp_res)
+
+
+def test_psd_short():
+    """Test if psd raises a ValueError for data shorter than one segment."""
+
+    rng = np.random.default_rng(1234)
+    arr = rng.random((3, 999))
+
+    with pytest.raises(ValueError):
+        psd(arr, fs=1000, resolution=1)
+
+
+def test_psd_float32():
+    """Test if a single precision openseize psd matches scipy's double
+    precision welch result."""
+
+    rng = np.random.default_rng(1234)
+    arr = rng.random((3, 4, 132026))
+
+    # psd parameters
+    fs = 1000
+    resolution = 1
+    overlap = 0.5
+    axis = -1
+
+    _, op_f, op_res = psd(arr, fs, axis, resolution, overlap=overlap,
+                          dtype=np.float32)
+
+    sp_f, sp_res = sps.welch(arr, fs=fs, nperseg=int(fs / resolution),
+                             noverlap=int(overlap * fs / resolution),
+                             axis=axis)
+
+    assert np.allclose(op_f, sp_f)
+    assert np.allclose(op_res, sp_res, rtol=1e-4, atol=1e-7)
+
+
+def test_welch_dtype():
+    """Test if welch promotes single precision data to double precision
+    estimates unless a dtype is given."""
+
+    rng = np.random.default_rng(1234)
+    arr = rng.random((3, 13202)).astype(np.float32)
+    pro = producer(arr, chunksize=1000, axis=-1)
+
+    _, segs = welch(pro, 500, 1000, 'hann', 0.5, -1, 'constant', 'density')
+    assert all(x.dtype == np.float64 for x in segs)
+
+    _, segs = welch(pro, 500, 1000, 'hann', 0.5, -1, 'constant', 'density',
+                    dtype=np.float32)
+    assert all(x.dtype == np.float32 for x in segs)
+
+
 def test_welch_nfft():
     """Test if openseize welch result matches scipy result for various
     numbers of FFT points."""
@@ -370,6 +472,44 @@ def test_welch_nfft():
         assert np.allclose(op_res, sp_res)
 
 
+def test_welch_chunksizes():
+    """Test if openseize welch result matches scipy result for producers
+    whose chunksizes are smaller than nfft up to a single chunk."""
+
+    rng = np.random.default_rng(1234)
+    arr = rng.random((3, 23017, 4))
+
+    chunksizes = [300, 1000, 4567, 23017, 50000]
+
+    # welch parameters
+    fs = 500
+    nfft = 1000
+    window='hann'
+    overlap=0.5
+    detrend = 'linear'
+    scaling = 'density'
+    return_onesided=True
+    axis = 1
+
+    for csize in chunksizes:
+
+        pro = producer(arr, chunksize=csize, axis=axis)
+        # openseize result
+        op_f, op_segs = welch(pro, fs, nfft, window, overlap, axis, detrend,
+                             scaling)
+
+        # get average of all periodograms in op_segs
+        op_res = np.mean([x for x in op_segs], axis=0)
+
+        # scipy result
+        sp_f, sp_res = sps.welch(arr, fs=fs, window=window, nperseg=nfft,
+                noverlap=int(overlap*nfft), detrend=detrend,
+                return_onesided=return_onesided, scaling=scaling, axis=axis)
+
+        assert np.allclose(op_f, sp_f)
+        assert np.allclose(op_res, sp_res)
+
+
 def test_stft_pros():
     """Test if Openseize's stft result matches scipy's result for a variety
     of producer sizes."""
@@ -570,6 +710,24 @@ def test_stft_padding():
         assert np.allclose(ostft, sstft)
 
 
+def test_stft_short():
+    """Test if stft returns arrays for data holding a single segment and
+    raises a ValueError for data shorter than a single segment."""
+
+    rng = np.random.default_rng(1234)
+    fs, resolution = 1000, 1
+
+    arr = rng.random((2, 3, 1000))
+    freqs, time, result = stft(arr, fs, resolution=resolution,
+                               boundary=False, padded=False)
+    assert result.shape == (2, 3, len(freqs), len(time))
+    assert result.dtype == np.complex128
+
+    with pytest.raises(ValueError):
+        stft(arr[..., :999], fs, resolution=resolution, boundary=False,
+             padded=False)
+
+
 def test_stft_scaling():
     """Test if Openseizes stft matches scipy for different scalings.
 